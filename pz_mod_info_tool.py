@@ -18,16 +18,25 @@ License: MIT
 """
 
 import os
+import re
 import sys
-import csv
+import queue
+import logging
+import threading
 import webbrowser
 import traceback
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import RotatingFileHandler
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Set, Tuple, Any, Union
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, filedialog, messagebox
 
+logger = logging.getLogger(__name__)
+
 # -------- Defaults --------
 DEFAULT_MOD_PATH = os.path.expandvars(
     r"%ProgramFiles(x86)%\Steam\steamapps\workshop\content\108600"
@@ -49,9 +58,164 @@ C = {
     "hover": "#224b74",
 }
 
+# Tcl helper that inserts a flat {iid values iid values ...} list into a
+# treeview, so populating the table costs one Python -> Tcl round trip
+_BULK_INSERT_TCL = """
+proc pz_bulk_insert {tree rows} {
+    foreach {iid values} $rows {
+        $tree insert {} end -id $iid -values $values
+    }
+}
+"""
+
 RIGHT_CARD_W = 360  # fixed width for the details panel
+DETAILS_PLACEHOLDER = ("Select a mod to see details", "", "")  # name, modid, workshopid
+SEARCH_DEBOUNCE_MS = 120  # delay after the last keystroke before filtering
+HOVER_THROTTLE_MS = 16  # at most one row-hover update per frame
+CSV_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer for CSV export
+CLIPBOARD_CHUNK = 1 << 20  # characters handed to Tk per clipboard_append call
+MODINFO_SEARCH_DEPTH = 3  # deepest layout: <workshopid>/mods/<modname>/42/mod.info
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # threads reading mod.info files
+SCAN_POLL_MS = 50  # how often the Tk thread drains background scan results
+SCAN_BATCH_ROWS = 200  # scanned mods added to the table per drain tick
+EXPORT_CHUNK_ROWS = 4096  # rows written between CSV export progress reports
+EXPORT_POLL_MS = 50  # how often the Tk thread drains CSV export progress
+
+# -------- mod.info parsing --------
+MODINFO_READ_LIMIT = 8192  # bytes read up front; the rest only if a key is missing
+_UTF8_BOM = b"\xef\xbb\xbf"
+# A key starts a line after \n, \r\n or a bare \r (old Mac line endings)
+_FIELD_RE = re.compile(rb"(?mi)(?:^|(?<=\r))[ \t]*(name|id)[ \t]*=([^\r\n]*)")
+
+
+def _parse_modinfo(data: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract the first non-empty name and id values from mod.info contents.
+    
+    Both keys are found by a single regex pass that stops as soon as both
+    are known. Keys must start a line, so commented-out keys never match.
+    Only captured values are decoded; surrounding whitespace and single or
+    double quotes are stripped.
+    
+    Args:
+        data: Raw mod.info contents, possibly starting with a UTF-8 BOM
+        
+    Returns:
+        (name, modid) tuple; either may be None if missing
+    """
+    if data.startswith(_UTF8_BOM):
+        data = data[len(_UTF8_BOM):]
+        
+    name = modid = None
+    for match in _FIELD_RE.finditer(data):
+        if match.group(1).lower() == b"name":
+            if name:
+                continue
+            name = match.group(2).decode("utf-8", "replace").strip().strip('"').strip("'") or None
+        else:
+            if modid:
+                continue
+            value = match.group(2).decode("utf-8", "replace").strip().strip('"').strip("'")
+            # Handle multi-value IDs (semicolon separated)
+            modid = value.split(";")[0].strip() or None
+        if name and modid:
+            break
+    return name, modid
+
+# -------- Data Model --------
+class Mod:
+    """
+    A single parsed mod entry.
+    
+    Uses ``__slots__`` rather than a per-mod dict, which keeps large mod
+    lists compact and makes attribute reads in the filter/sort loops cheap.
+    
+    Attributes:
+        name: Display name from mod.info
+        modid: Mod ID from mod.info (first value if several are listed)
+        workshopid: Steam Workshop ID (the workshop item folder name)
+        name_lc: Case-folded name, used for sorting
+        modid_lc: Case-folded mod ID, used for sorting
+        search: Case-folded name, modid and workshopid, newline separated
+        workshopid_int: Workshop ID as an int for numeric sorting, or None
+        workshopid_key: WorkshopID sort key; numeric IDs first, others after by text
+    """
+    __slots__ = ("name", "modid", "workshopid", "name_lc", "modid_lc",
+                 "search", "workshopid_int", "workshopid_key")
+    
+    def __init__(self, name: str, modid: str, workshopid: str) -> None:
+        self.name = name
+        self.modid = modid
+        self.workshopid = workshopid
+        # Case-folded once here (casefold, not lower, so non-ASCII titles
+        # compare correctly); filtering is then a single substring test
+        self.name_lc = name.casefold()
+        self.modid_lc = modid.casefold()
+        self.search = f"{self.name_lc}\n{self.modid_lc}\n{workshopid.casefold()}"
+        # Parsed once so sorting never has to retry int() per click;
+        # isdecimal() accepts exactly the digits int() does, so no try/except
+        self.workshopid_int: Optional[int] = (
+            int(workshopid) if workshopid.isdecimal() else None
+        )
+        self.workshopid_key: Tuple[int, Union[int, str]] = (
+            (0, self.workshopid_int) if self.workshopid_int is not None
+            else (1, workshopid.casefold())
+        )
+
+# -------- Sort Keys --------
+# Every column's key is precomputed on Mod, so a C-level attrgetter
+# replaces a Python key function call per row
+_SORT_KEYS = {
+    "Name": attrgetter("name_lc"),
+    "ModID": attrgetter("modid_lc"),
+    "WorkshopID": attrgetter("workshopid_key"),
+}
+
+# -------- CSV Export --------
+# Hand-rolled equivalent of csv.writer's default (excel) dialect: fields are
+# quoted only when they hold a comma, quote or line break, rows end in \r\n
+_CSV_HEADER = "Name,ModID,WorkshopID\r\n"
+_CSV_NEEDS_QUOTES = re.compile(r'[,"\r\n]').search
+
+
+def _csv_field(value: str) -> str:
+    if _CSV_NEEDS_QUOTES(value) is None:
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _csv_lines(mods: List[Mod]) -> str:
+    """
+    Format mods as CSV rows, byte-for-byte what csv.writer would produce.
+    
+    Most rows need no quoting at all, so each row is checked with a single
+    regex search over its three fields and only escaped field by field when
+    that finds something.
+    """
+    needs_quotes = _CSV_NEEDS_QUOTES
+    lines: List[str] = []
+    append = lines.append
+    for mod in mods:
+        name, modid, workshopid = mod.name, mod.modid, mod.workshopid
+        if needs_quotes(name + modid + workshopid) is None:
+            append(f"{name},{modid},{workshopid}\r\n")
+        else:
+            append(f"{_csv_field(name)},{_csv_field(modid)},{_csv_field(workshopid)}\r\n")
+    return "".join(lines)
 
 # -------- Error Handling --------
+def _setup_logging() -> None:
+    """
+    Route warnings from scans and parsing to a small rotating log file.
+    
+    The file is only created once something is actually logged, and is
+    kept to a few MB so it never grows unbounded on broken workshop folders.
+    """
+    handler = RotatingFileHandler("pz_mod_tool.log", maxBytes=1 << 20,
+                                  backupCount=2, encoding="utf-8", delay=True)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
+    logging.getLogger().addHandler(handler)
+
 def _fatal(msg: str) -> None:
     """
     Handle fatal application errors with comprehensive logging and user notification.
@@ -137,7 +301,7 @@ class ModInfoApp:
         mod_folder: StringVar containing current mod folder path
         search_var: StringVar containing current search/filter text
         status_var: StringVar containing current status message
-        mods: List of dictionaries containing parsed mod information
+        mods: List of Mod entries containing parsed mod information
         tree: Treeview widget displaying the mod table
     """
     
@@ -158,10 +322,30 @@ class ModInfoApp:
             value=DEFAULT_MOD_PATH if os.path.isdir(DEFAULT_MOD_PATH) else ""
         )
         self.search_var = tk.StringVar()
+        self._lower_query = ""  # Case-folded search_var value, refreshed on write
+        self.search_var.trace_add("write", self._on_query_changed)
         self.status_var = tk.StringVar(value="Ready.")
-        self.mods: List[Dict[str, str]] = []  # Parsed mod information
+        self.mods: List[Mod] = []  # Parsed mod information
         self._sort_dir: Dict[str, bool] = {}  # Column sort directions
+        self._order: List[int] = []  # Tree item pool (mod indices) in sort order
+        self._shown: List[int] = []  # Currently attached items, in display order
+        self._sort_cache: Dict[Tuple[str, bool], List[int]] = {}  # Sorted pool orders
+        self._search_blob = ""  # All Mod.search keys, NUL separated, for bulk substring search
+        self._search_offsets: List[int] = []  # Start of each mod's key within the blob
+        self._last_query: Optional[str] = None  # Query the shown rows were filtered with
+        self._search_after: Optional[str] = None  # Pending debounced search callback
+        self._scan_queue: Optional[queue.Queue] = None  # Messages from the running scan
+        self._scan_cancel: Optional[threading.Event] = None  # Stops the running scan
+        self._scan_poll: Optional[str] = None  # Pending scan queue drain callback
+        self._export_queue: Optional[queue.Queue] = None  # Messages from the running export
+        self._export_thread: Optional[threading.Thread] = None  # Writer of the latest export
+        self._export_poll: Optional[str] = None  # Pending export queue drain callback
         self._last_hover: Optional[str] = None  # Last hovered tree item
+        self._hover_y: int = -1  # Latest pointer y reported by <Motion>
+        self._hover_last_y: int = -1  # Pointer y the hover row was last computed for
+        self._hover_pending: Optional[str] = None  # Pending throttled hover update
+        self._selected: Tuple[str, ...] = ()  # Selection as of the last <<TreeviewSelect>>
+        self._detail_state: Tuple[str, str, str] = DETAILS_PLACEHOLDER  # Shown in details panel
 
         # Initialize UI components
         self._setup_style()
@@ -211,7 +395,7 @@ class ModInfoApp:
                   foreground=[("!disabled", C["text"])])
 
         style.configure("Treeview",
-                        background=C["card"],
+                        background=C["row_even"],  # Even stripe; "odd" tag overrides
                         fieldbackground=C["card"],
                         foreground=C["text"],
                         rowheight=28,
@@ -301,9 +485,9 @@ class ModInfoApp:
         hsb.grid(row=1, column=0, sticky="ew")
         table_wrap.rowconfigure(0, weight=1); table_wrap.columnconfigure(0, weight=1)
 
-        self.tree.tag_configure("even", background=C["row_even"])
         self.tree.tag_configure("odd", background=C["row_odd"])
         self.tree.tag_configure("hover", background=C["hover"])
+        self.tree.tk.eval(_BULK_INSERT_TCL)
 
         self.tree.bind("<<TreeviewSelect>>", self._update_details)
         self.tree.bind("<Motion>", self._hover_row)
@@ -320,25 +504,23 @@ class ModInfoApp:
         ttk.Label(right_card, text="Details", style="Card.TLabel").pack(anchor="w", padx=12, pady=(10,0))
         dwrap = ttk.Frame(right_card, style="Card.TFrame"); dwrap.pack(fill="both", expand=True, padx=12, pady=8)
 
-        self.d_name = tk.StringVar(value="Select a mod to see details")
-        self.d_modid = tk.StringVar()
-        self.d_wid = tk.StringVar()
-
-        self.name_lbl = ttk.Label(dwrap, textvariable=self.d_name,
+        # Detail labels are updated directly via configure(text=...)
+        name, modid, wid = DETAILS_PLACEHOLDER
+        self.name_lbl = ttk.Label(dwrap, text=name,
                                   style="Card.TLabel", font=("Segoe UI", 12, "bold"),
                                   wraplength=RIGHT_CARD_W-24, justify="left")
         self.name_lbl.pack(anchor="w", pady=(4,6))
         ttk.Frame(dwrap, style="Stroke.TFrame").pack(fill="x", pady=4)
 
         ttk.Label(dwrap, text="Mod ID", style="Sub.TLabel").pack(anchor="w", pady=(2,0))
-        self.modid_lbl = ttk.Label(dwrap, textvariable=self.d_modid,
+        self.modid_lbl = ttk.Label(dwrap, text=modid,
                                    style="Card.TLabel", font=self._sfont,
                                    wraplength=RIGHT_CARD_W-24, justify="left")
         self.modid_lbl.pack(anchor="w")
         ttk.Frame(dwrap, style="Stroke.TFrame").pack(fill="x", pady=4)
 
         ttk.Label(dwrap, text="Workshop ID", style="Sub.TLabel").pack(anchor="w", pady=(2,0))
-        self.wid_lbl = ttk.Label(dwrap, textvariable=self.d_wid,
+        self.wid_lbl = ttk.Label(dwrap, text=wid,
                                  style="Card.TLabel", font=("Segoe UI", 9, "bold"),
                                  wraplength=RIGHT_CARD_W-24, justify="left")
         self.wid_lbl.pack(anchor="w")
@@ -361,24 +543,34 @@ class ModInfoApp:
 
     # ---------- Hover ----------
     def _hover_row(self, event):
-        iid = self.tree.identify_row(event.y)
+        # Just record the pointer; the row lookup runs at most once per frame
+        self._hover_y = event.y
+        if self._hover_pending is None:
+            self._hover_pending = self.root.after(HOVER_THROTTLE_MS, self._apply_hover)
+
+    def _apply_hover(self):
+        self._hover_pending = None
+        if self._hover_y == self._hover_last_y:
+            return
+        self._hover_last_y = self._hover_y
+        iid = self.tree.identify_row(self._hover_y)
         if iid == self._last_hover:
             return
-        if self._last_hover and self.tree.exists(self._last_hover):
-            tags = [t for t in self.tree.item(self._last_hover, "tags") if t != "hover"]
-            self.tree.item(self._last_hover, tags=tags)
+        # "tag add/remove" touch just the hover tag, no read-modify-write of item tags
+        if self._last_hover:
+            self.tree.tk.call(str(self.tree), "tag", "remove", "hover", self._last_hover)
         if iid:
-            tags = list(self.tree.item(iid, "tags"))
-            if "hover" not in tags:
-                tags.append("hover")
-            self.tree.item(iid, tags=tags)
+            self.tree.tk.call(str(self.tree), "tag", "add", "hover", iid)
         self._last_hover = iid
 
     def _clear_hover(self):
-        if self._last_hover and self.tree.exists(self._last_hover):
-            tags = [t for t in self.tree.item(self._last_hover, "tags") if t != "hover"]
-            self.tree.item(self._last_hover, tags=tags)
+        if self._hover_pending is not None:
+            self.root.after_cancel(self._hover_pending)
+            self._hover_pending = None
+        if self._last_hover:
+            self.tree.tk.call(str(self.tree), "tag", "remove", "hover", self._last_hover)
         self._last_hover = None
+        self._hover_last_y = -1
 
     # ---------- Event Bindings ----------
     def _bind_keys(self) -> None:
@@ -412,6 +604,20 @@ class ModInfoApp:
         self._menu.add_separator()
         self._menu.add_command(label="Open Folder in Explorer", command=self.open_folder)
         self.tree.bind("<Button-3>", self._popup_menu)
+        
+        # Stop background work when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        """
+        Cancel a running scan, then close the window.
+        
+        Cancelling drops the scan's queued mod.info reads, so the process
+        doesn't stay alive working through them after the window is gone.
+        """
+        if self._scan_cancel is not None:
+            self._scan_cancel.set()
+        self.root.destroy()
 
     # ---------- Actions ----------
     def browse_folder(self):
@@ -437,9 +643,11 @@ class ModInfoApp:
         """
         Scan the specified directory for Project Zomboid mod information.
         
-        Iterates through all subdirectories in the selected folder, attempts to
-        locate and parse mod.info files, and populates the mod list with discovered
-        information. Updates the UI in real-time with progress and results.
+        Validates the folder and starts a background worker that iterates
+        through all subdirectories, locating and parsing mod.info files. The
+        worker reports back through a queue that the Tk thread drains
+        periodically, so the UI stays responsive and shows progress while the
+        mod list fills up. Starting a new scan cancels one still in progress.
         
         Handles various error conditions gracefully including:
         - Missing or invalid folder paths
@@ -458,58 +666,135 @@ class ModInfoApp:
             messagebox.showerror("Error", f"Folder does not exist: {folder_path}")
             return
 
+        # Abandon a scan that is still running; its queue is no longer drained
+        if self._scan_cancel is not None:
+            self._scan_cancel.set()
+
         # Clear previous results and update UI
         self.mods.clear()
-        self.tree.delete(*self.tree.get_children())
+        self._populate_tree()
         self.status_var.set("Scanning…")
-        self.root.update_idletasks()
 
+        self._scan_queue = queue.Queue()
+        self._scan_cancel = threading.Event()
+        threading.Thread(target=self._scan_worker,
+                         args=(folder_path, self._scan_queue, self._scan_cancel),
+                         daemon=True).start()
+        if self._scan_poll is None:
+            self._scan_poll = self.root.after(SCAN_POLL_MS, self._drain_scan_queue)
+
+    def _scan_worker(self, folder_path: str, results: queue.Queue,
+                     cancel: threading.Event) -> None:
+        """
+        Scan a mod folder on a background thread.
+        
+        Never touches Tk; everything is reported through the results queue as
+        ("mod", info), ("progress", folders_checked), ("error", message) and
+        finally ("done", folders_checked, mods_found).
+        
+        Args:
+            folder_path: Folder containing one subdirectory per workshop item
+            results: Queue drained by _drain_scan_queue on the Tk thread
+            cancel: Set when this scan has been superseded
+        """
         scanned_count = 0
         found_count = 0
         
         try:
             # Use os.scandir for better performance than os.listdir
             with os.scandir(folder_path) as entries:
-                for entry in entries:
-                    if entry.is_dir():
-                        scanned_count += 1
-                        
-                        # Update progress for large directories
-                        if scanned_count % 25 == 0:
-                            self.status_var.set(f"Scanning… ({scanned_count} folders checked)")
-                            self.root.update_idletasks()
+                mod_dirs = [entry for entry in entries if entry.is_dir()]
+                
+            # Parsing is pure file I/O, so overlap the reads on a thread pool
+            executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+            futures = [executor.submit(self._read_mod_info, mod_dir) for mod_dir in mod_dirs]
+            try:
+                for future in futures:
+                    if cancel.is_set():
+                        return
+                    mod_info = future.result()
+                    scanned_count += 1
+                    
+                    # Report progress for large directories
+                    if scanned_count % 25 == 0:
+                        results.put(("progress", scanned_count))
                         
-                        mod_info = self._read_mod_info(entry.path, entry.name)
-                        if mod_info:
-                            self.mods.append(mod_info)
-                            found_count += 1
+                    if mod_info:
+                        results.put(("mod", mod_info))
+                        found_count += 1
+            finally:
+                # On cancel, drop the reads that haven't started instead of
+                # letting the pool work through (and the process wait on) them
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
                             
         except PermissionError:
-            messagebox.showerror("Error", f"Permission denied accessing: {folder_path}")
+            results.put(("error", f"Permission denied accessing: {folder_path}"))
         except OSError as e:
-            messagebox.showerror("Error", f"System error reading folder: {e}")
+            results.put(("error", f"System error reading folder: {e}"))
         except Exception as e:
-            traceback.print_exc()
-            messagebox.showerror("Error", f"Unexpected error during scan: {e}")
+            logger.exception("Unexpected error scanning %s", folder_path)
+            results.put(("error", f"Unexpected error during scan: {e}"))
         finally:
-            self._apply_filter()
-            self.status_var.set(f"Found {found_count} mods (scanned {scanned_count} folders)")
+            results.put(("done", scanned_count, found_count))
+
+    def _drain_scan_queue(self) -> None:
+        """
+        Apply messages posted by the running scan worker on the Tk thread.
+        
+        Streams discovered mods into the table, at most SCAN_BATCH_ROWS per
+        tick so the window keeps redrawing, and updates progress. Reschedules
+        itself right away while results are backed up, otherwise after
+        SCAN_POLL_MS, until the scan completes.
+        """
+        self._scan_poll = None
+        results = self._scan_queue
+        if results is None:
+            return
+            
+        start = len(self.mods)
+        append = self.mods.append
+        delay = 1  # More results are already waiting unless the queue runs dry
+        try:
+            while len(self.mods) - start < SCAN_BATCH_ROWS:
+                message = results.get_nowait()
+                kind = message[0]
+                if kind == "mod":
+                    append(message[1])
+                elif kind == "progress":
+                    self.status_var.set(f"Scanning… ({message[1]} folders checked)")
+                elif kind == "error":
+                    messagebox.showerror("Error", message[1])
+                elif kind == "done":
+                    _, scanned_count, found_count = message
+                    self._scan_queue = None
+                    self._scan_cancel = None
+                    self._append_rows(start)
+                    self.status_var.set(f"Found {found_count} mods (scanned {scanned_count} folders)")
+                    return
+        except queue.Empty:
+            delay = SCAN_POLL_MS
+            
+        self._append_rows(start)
+        self._scan_poll = self.root.after(delay, self._drain_scan_queue)
 
     # ---- Parser
-    def _read_mod_info(self, mod_path: str, workshopid: str) -> Optional[Dict[str, str]]:
+    def _read_mod_info(self, mod_dir: "os.DirEntry[str]") -> Optional[Mod]:
         """
         Parse mod information from a mod.info file in the given directory.
         
         Searches for mod.info file in the root directory and subdirectories,
         then extracts the mod name and ID using robust parsing that handles
-        various file formats and encoding issues.
+        various file formats and encoding issues. The root file is simply
+        opened rather than stat'ed first, and subdirectories are found via
+        scandir entries, which keeps the number of stat calls per mod low.
         
         Args:
-            mod_path: Path to the mod directory to search
-            workshopid: Workshop ID (typically the directory name)
+            mod_dir: Directory entry of the workshop item; its name is the Workshop ID
             
         Returns:
-            Dictionary with 'name', 'modid', and 'workshopid' keys, or None if parsing fails
+            Mod entry with name, modid and workshopid, or None if parsing fails
             
         Note:
             Handles various edge cases including:
@@ -520,114 +805,284 @@ class ModInfoApp:
             - Different encoding formats
         """
         def find_modinfo(root: str) -> Optional[str]:
-            """Recursively search for mod.info file."""
-            # Check root directory first for performance
-            direct_path = os.path.join(root, "mod.info")
-            if os.path.isfile(direct_path):
-                return direct_path
-                
-            # Search subdirectories if not found in root
-            try:
-                for subroot, _dirs, files in os.walk(root):
-                    if "mod.info" in files:
-                        return os.path.join(subroot, "mod.info")
-            except (OSError, PermissionError):
-                # Skip directories we can't access
-                pass
+            """Breadth-first search for mod.info, at most MODINFO_SEARCH_DEPTH levels deep."""
+            # Search subdirectories level by level, stopping at the first hit.
+            # Workshop items keep their mods under "mods", so it is visited first.
+            level = [root]
+            for depth in range(MODINFO_SEARCH_DEPTH + 1):
+                subdirs: List[str] = []
+                for directory in level:
+                    try:
+                        with os.scandir(directory) as entries:
+                            for entry in entries:
+                                if entry.is_dir(follow_symlinks=False):
+                                    if depth < MODINFO_SEARCH_DEPTH:
+                                        if entry.name == "mods":
+                                            subdirs.insert(0, entry.path)
+                                        else:
+                                            subdirs.append(entry.path)
+                                elif entry.name == "mod.info" and entry.is_file():
+                                    return entry.path
+                    except OSError:
+                        # Skip directories we can't access
+                        continue
+                level = subdirs
                 
             return None
             
-        mod_info_path = find_modinfo(mod_path)
-        if not mod_info_path:
-            return None
+        def read_modinfo(path: str, limit: int = MODINFO_READ_LIMIT) -> bytes:
+            """Read raw bytes, by default only the first MODINFO_READ_LIMIT of them."""
+            with open(path, "rb") as f:
+                return f.read(limit)
 
-        name = modid = None
-        
+        # Check root directory first for performance
+        mod_info_path = os.path.join(mod_dir.path, "mod.info")
         try:
-            # Handle various encodings and BOM characters
-            with open(mod_info_path, "r", encoding="utf-8-sig", errors="replace") as f:
-                for line_num, raw_line in enumerate(f, 1):
-                    # Prevent reading extremely long files (likely corrupted)
-                    if line_num > 500:
-                        break
-                        
-                    line = raw_line.strip()
-                    
-                    # Skip empty lines, comments, and malformed lines
-                    if (not line or "=" not in line or 
-                        line.startswith("#") or line.startswith("//")):
-                        continue
-                        
-                    try:
-                        key, value = line.split("=", 1)
-                        key = key.strip().lower()
-                        value = value.strip().strip('"').strip("'")
-                        
-                        if key == "name" and not name and value:
-                            name = value
-                        elif key == "id" and not modid and value:
-                            # Handle multi-value IDs (semicolon separated)
-                            modid = value.split(";")[0].strip()
-                            
-                        # Early exit if we have both required fields
-                        if name and modid:
-                            break
-                            
-                    except ValueError:
-                        # Skip malformed lines
-                        continue
+            try:
+                data = read_modinfo(mod_info_path)
+            except FileNotFoundError:
+                # Search subdirectories if not found in root
+                found_path = find_modinfo(mod_dir.path)
+                if not found_path:
+                    return None
+                mod_info_path = found_path
+                data = read_modinfo(mod_info_path)
+                
+            # A full buffer may end mid-line; drop that partial line so a key
+            # cut at the boundary isn't taken as a (truncated) value
+            truncated = len(data) >= MODINFO_READ_LIMIT
+            if truncated:
+                data = data[:max(data.rfind(b"\n"), data.rfind(b"\r")) + 1]
+                
+            name, modid = _parse_modinfo(data)
+            
+            # A long line (e.g. a description) can push a key past the fast
+            # read; only then is the whole file read and parsed again
+            if not (name and modid) and truncated:
+                name, modid = _parse_modinfo(read_modinfo(mod_info_path, -1))
                         
             # Return parsed information if we have required fields
             if name and modid:
-                return {
-                    "name": name,
-                    "modid": modid,
-                    "workshopid": str(workshopid)
-                }
+                return Mod(name, modid, mod_dir.name)
                 
         except (OSError, IOError):
             # File access error - silently skip this mod
             pass
         except Exception as e:
             # Log unexpected errors but don't crash the scan
-            print(f"Warning: Error parsing {mod_info_path}: {e}")
+            logger.warning("Error parsing %s: %s", mod_info_path, e)
             
         return None
 
     # ---- Table operations
+    def _populate_tree(self) -> None:
+        """
+        Rebuild the Treeview item pool from the current mod list.
+        
+        Every mod gets exactly one tree item, whose iid is its index in
+        ``self.mods``. Items are created once per scan, in a single Tcl call
+        per batch; filtering and sorting only detach and move them afterwards
+        instead of re-inserting rows.
+        """
+        # Detached items are not returned by get_children(), so drop the whole pool
+        self.tree.delete(*self._order)
+        self._last_hover = None
+        self._search_blob = ""
+        self._search_offsets = []
+        self._order = []
+        self._shown = []
+        # Streamed rows are filtered as they arrive, so the (empty) table
+        # counts as already filtered with the current query
+        self._last_query = self._lower_query
+        self._append_rows(0)
+        self._update_details()
+
+    def _append_rows(self, start: int) -> None:
+        """
+        Add the mods from ``self.mods[start:]`` to the tree item pool.
+        
+        Creates their items in a single Tcl call, appends their search keys
+        to the packed search blob, and keeps on display only those matching
+        the query the shown rows were filtered with, striped by position.
+        Used both to rebuild the pool and to stream in rows while a scan is
+        still running.
+        
+        Args:
+            start: Index of the first mod not yet in the pool
+        """
+        mods = self.mods
+        added = range(start, len(mods))
+        if not added:
+            return
+            
+        tree = self.tree
+        tree_path = str(tree)
+        rows: List[Any] = []
+        append = rows.append
+        for index in added:
+            mod = mods[index]
+            append(str(index))
+            append((mod.name, mod.modid, mod.workshopid))
+        tree.tk.call("pz_bulk_insert", tree_path, tuple(rows))
+        
+        # Pack the search keys into one string so a full filter is a
+        # handful of C-level str.find calls instead of a Python loop
+        blob = self._search_blob
+        offsets = self._search_offsets
+        add_offset = offsets.append
+        position = len(blob) + 1 if start else 0
+        for index in added:
+            add_offset(position)
+            position += len(mods[index].search) + 1
+        keys = "\0".join(mods[index].search for index in added)
+        self._search_blob = f"{blob}\0{keys}" if start else keys
+        
+        self._order.extend(added)
+        self._sort_cache = {}
+        
+        # Inserted items are attached at the end; hide the ones the current
+        # filter excludes, then stripe the rest by their display position
+        query = self._last_query
+        if query:
+            matched = [index for index in added if query in mods[index].search]
+            if len(matched) != len(added):
+                keep = set(matched)
+                tree.detach(*[index for index in added if index not in keep])
+        else:
+            matched = list(added)
+        shown = self._shown
+        first = len(shown)
+        shown.extend(matched)
+        odd = matched[1 - first % 2::2]
+        if odd:
+            tree.tk.call(tree_path, "tag", "add", "odd", tuple(odd))
+
+    def _show_rows(self, rows: List[int], subset: bool = False) -> None:
+        """
+        Attach exactly the given pool items to the table, in the given order.
+        
+        Replaces the root's child list in a single Tcl call; items left out
+        are detached, the rest are re-attached in order. When ``rows`` is
+        known to be an ordered subset of the shown rows, only the dropped
+        items are detached. Even rows use the Treeview's own background, so
+        striping is just moving the "odd" tag: two Tcl calls no matter how
+        many rows are shown.
+        
+        Args:
+            rows: Mod indices (tree iids) to display, in display order
+            subset: True if rows only removes items from the current display
+        """
+        tree = self.tree
+        if subset:
+            keep = set(rows)
+            hidden = [index for index in self._shown if index not in keep]
+            self._shown = rows
+            if not hidden:
+                return  # Nothing moved, so the stripes are still right
+            tree.detach(*hidden)
+        else:
+            tree.set_children("", *rows)
+            self._shown = rows
+            
+        # Restripe in bulk: clear the odd tag everywhere, then add it back by position
+        tree_path = str(tree)
+        call = tree.tk.call
+        call(tree_path, "tag", "remove", "odd")
+        if len(rows) > 1:
+            call(tree_path, "tag", "add", "odd", tuple(rows[1::2]))
+
     def _apply_filter(self) -> None:
         """
         Apply current search filter to the mod list and update the table display.
         
         Filters the mod list based on the current search query, performing
         case-insensitive matching across mod name, mod ID, and workshop ID fields.
-        Updates the table with alternating row colors and refreshes the status bar
-        with current counts.
-        """
-        query = self.search_var.get().lower().strip()
+        Matching items from the tree pool are re-attached with alternating row
+        colors and the status bar is refreshed with current counts.
         
-        # Clear existing table entries
-        self.tree.delete(*self.tree.get_children())
+        A query that extends the previous one can only narrow the result, so
+        in that case only the currently shown rows are re-tested and the
+        misses are detached.
+        """
+        # Any pending debounced search is superseded by this pass
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+            self._search_after = None
+            
+        query = self._lower_query
+        last_query = self._last_query
+        self._last_query = query
+        narrowing = bool(last_query) and query.startswith(last_query)
         
         # Filter mods based on search query
-        filtered_rows = []
-        for mod in self.mods:
-            if (not query or 
-                query in mod["name"].lower() or 
-                query in mod["modid"].lower() or 
-                query in mod["workshopid"].lower()):
-                filtered_rows.append((mod["name"], mod["modid"], mod["workshopid"]))
-        
-        # Populate table with filtered results and alternating colors
-        for index, values in enumerate(filtered_rows):
-            tag = "even" if index % 2 == 0 else "odd"
-            self.tree.insert("", "end", values=values, tags=(tag,))
+        if narrowing:
+            mods = self.mods
+            rows = [index for index in self._shown if query in mods[index].search]
+        elif query:
+            matches = self._find_matches(query)
+            rows = [index for index in self._order if index in matches]
+        else:
+            rows = list(self._order)
             
-        # Update status and details panel
-        self.status_var.set(f"{len(filtered_rows)} shown / {len(self.mods)} total")
-        self._update_details()
+        self._show_rows(rows, subset=narrowing)
+            
+        # Keep the selection on rows that are still shown; the details panel
+        # then follows through <<TreeviewSelect>> only if the selection changed
+        if self._selected:
+            shown = set(rows)
+            kept = [iid for iid in self._selected if int(iid) in shown]
+            if len(kept) != len(self._selected):
+                self.tree.selection_set(kept)
+                
+        # Update status
+        self.status_var.set(f"{len(rows)} shown / {len(self.mods)} total")
+
+    def _find_matches(self, query: str) -> Set[int]:
+        """
+        Find every mod whose search key contains query.
+        
+        Scans the packed search blob with str.find and maps each hit back to
+        its mod via bisect on the key offsets, then resumes the scan at the
+        next mod's key.
+        
+        Args:
+            query: Normalized (stripped, case-folded) search text
+            
+        Returns:
+            Set of matching mod indices
+        """
+        blob = self._search_blob
+        offsets = self._search_offsets
+        count = len(offsets)
+        matches: Set[int] = set()
+        find = blob.find
+        add = matches.add
+        start = 0
+        while True:
+            position = find(query, start)
+            if position < 0:
+                break
+            index = bisect_right(offsets, position) - 1
+            add(index)
+            if index + 1 >= count:
+                break
+            start = offsets[index + 1]
+        return matches
+
+    def _on_query_changed(self, *_):
+        self._lower_query = self.search_var.get().strip().casefold()
 
     def _on_search(self, _=None):
+        # Ignore key releases that didn't change the query (arrows, Shift, ...)
+        if self._lower_query == self._last_query:
+            return
+        # Coalesce a burst of keystrokes into a single filter pass
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after = None
         self._apply_filter()
 
     def _clear_search(self):
@@ -635,11 +1090,20 @@ class ModInfoApp:
         self._apply_filter()
 
     def _update_details(self, _evt=None):
-        sel = self.tree.selection()
-        if not sel:
-            self.d_name.set("Select a mod to see details"); self.d_modid.set(""); self.d_wid.set(""); return
-        name, modid, wid = self.tree.item(sel[0], "values")
-        self.d_name.set(name); self.d_modid.set(modid); self.d_wid.set(wid)
+        sel = self._selected = self.tree.selection()
+        if sel:
+            mod = self.mods[int(sel[0])]
+            state = (mod.name, mod.modid, mod.workshopid)
+        else:
+            state = DETAILS_PLACEHOLDER
+        if state == self._detail_state:
+            return
+        # Only reconfigure the labels whose text actually changed
+        for label, old, new in zip((self.name_lbl, self.modid_lbl, self.wid_lbl),
+                                   self._detail_state, state):
+            if old != new:
+                label.configure(text=new)
+        self._detail_state = state
 
     def _popup_menu(self, e) -> None:
         """
@@ -688,8 +1152,8 @@ class ModInfoApp:
         Removes selection from all table items, updates the details panel,
         and provides user feedback via the status bar.
         """
-        for item_id in self.tree.selection():
-            self.tree.selection_remove(item_id)
+        # One Tcl call, rather than a selection_remove per selected row
+        self.tree.selection_set(())
         self._update_details()
         self.status_var.set("Selection cleared.")
 
@@ -702,53 +1166,37 @@ class ModInfoApp:
         - WorkshopID: Numeric sorting with fallback to string
         - Name/ModID: Case-insensitive alphabetic sorting
         
+        Sorts the whole item pool on the Python side (never reading values
+        back from the tree), keeps the current filter, and caches each
+        (column, direction) order until the next scan.
+        
         Maintains alternating row colors after sorting and toggles
         sort direction for consecutive clicks on the same column.
         
         Args:
             col: Column name to sort by ("Name", "ModID", or "WorkshopID")
         """
-        items = list(self.tree.get_children())
-        if not items:
+        if not self._shown:
             return
             
-        # Map column names to indices
-        column_indices = {"Name": 0, "ModID": 1, "WorkshopID": 2}
-        column_index = column_indices[col]
-        
         # Get current sort direction (toggle on repeat clicks)
         reverse_sort = self._sort_dir.get(col, False)
-
-        def sort_key(item_id: str) -> Union[int, str]:
-            """
-            Generate appropriate sort key based on column type.
-            
-            Args:
-                item_id: Tree item identifier
-                
-            Returns:
-                Sort key (int for WorkshopID, lowercase string for others)
-            """
-            value = self.tree.item(item_id, "values")[column_index]
-            
-            # Special handling for WorkshopID (numeric sort)
-            if column_index == 2:  # WorkshopID column
-                try:
-                    return int(value)
-                except (ValueError, TypeError):
-                    return (value or "").lower()  # Fallback to string sort
+        
+        order = self._sort_cache.get((col, reverse_sort))
+        if order is None:
+            mods = self.mods
             
-            # String sorting for Name and ModID columns
-            return (value or "").lower()
+            # Decorate: compute every sort key once, in a single pass,
+            # so the sort itself only does C-level comparisons of ready-made keys
+            keys = list(map(_SORT_KEYS[col], mods))
 
-        # Sort items using appropriate key function
-        items.sort(key=sort_key, reverse=reverse_sort)
-        
-        # Reorder items in tree and refresh alternating colors
-        for position, item_id in enumerate(items):
-            self.tree.move(item_id, "", position)
-            tag = "even" if position % 2 == 0 else "odd"
-            self.tree.item(item_id, tags=(tag,))
+            order = sorted(range(len(mods)), key=keys.__getitem__, reverse=reverse_sort)
+            self._sort_cache[(col, reverse_sort)] = order
+            
+        # Reorder items in tree, keeping the current filter, and refresh alternating colors
+        self._order = order
+        shown = set(self._shown)
+        self._show_rows([index for index in order if index in shown])
             
         # Toggle sort direction for next click
         self._sort_dir[col] = not reverse_sort
@@ -758,15 +1206,18 @@ class ModInfoApp:
         """
         Safely set clipboard contents with error handling.
         
-        Clears existing clipboard content and sets new text.
-        Handles potential clipboard access issues gracefully.
+        Clears existing clipboard content and sets new text, appending it in
+        CLIPBOARD_CHUNK pieces so huge copies aren't marshalled to Tcl as one
+        giant string. Handles potential clipboard access issues gracefully.
         
         Args:
             text: Text content to copy to clipboard
         """
         try:
             self.root.clipboard_clear()
-            self.root.clipboard_append(text)
+            append = self.root.clipboard_append
+            for start in range(0, len(text), CLIPBOARD_CHUNK):
+                append(text[start:start + CLIPBOARD_CHUNK])
         except Exception:
             # Clipboard access might fail in some environments
             pass
@@ -784,11 +1235,13 @@ class ModInfoApp:
             messagebox.showinfo("Copy", "No mods selected.")
             return
             
-        lines = []
-        for item_id in selection:
-            name, modid, workshop_id = self.tree.item(item_id, "values")
-            lines.append(f"Name={name}; ID={modid}; WorkshopID={workshop_id}")
-            
+        # Tree iids are indices into self.mods, so read values Python-side
+        # Build all lines in one comprehension so join() gets a sized list
+        mods = self.mods
+        lines = [
+            f"Name={mod.name}; ID={mod.modid}; WorkshopID={mod.workshopid}"
+            for mod in map(mods.__getitem__, map(int, selection))
+        ]
         self._clipboard_set("\n".join(lines))
         self.status_var.set(f"Copied {len(selection)} mod(s) - complete info.")
 
@@ -804,7 +1257,8 @@ class ModInfoApp:
             messagebox.showinfo("Copy", "No mods selected.")
             return
             
-        mod_ids = [self.tree.item(item_id, "values")[1] for item_id in selection]
+        mods = self.mods
+        mod_ids = [mod.modid for mod in map(mods.__getitem__, map(int, selection))]
         self._clipboard_set("\n".join(mod_ids))
         self.status_var.set(f"Copied {len(mod_ids)} Mod ID(s).")
 
@@ -820,7 +1274,8 @@ class ModInfoApp:
             messagebox.showinfo("Copy", "No mods selected.")
             return
             
-        workshop_ids = [self.tree.item(item_id, "values")[2] for item_id in selection]
+        mods = self.mods
+        workshop_ids = [mod.workshopid for mod in map(mods.__getitem__, map(int, selection))]
         self._clipboard_set("\n".join(workshop_ids))
         self.status_var.set(f"Copied {len(workshop_ids)} Workshop ID(s).")
 
@@ -829,8 +1284,9 @@ class ModInfoApp:
         Export currently filtered mod data to a CSV file.
         
         Opens a file save dialog and exports all mods that match the current
-        search filter to a CSV file with headers. Handles encoding properly
-        for international characters in mod names.
+        search filter, in the table's current sort order, to a CSV file with
+        headers. Handles encoding properly for international characters in
+        mod names.
         
         The exported CSV includes columns: Name, ModID, WorkshopID
         """
@@ -838,6 +1294,11 @@ class ModInfoApp:
             messagebox.showinfo("Export", "No mods to export. Please scan a folder first.")
             return
             
+        # One export at a time: stopping a running one would leave a partial file
+        if self._export_thread is not None and self._export_thread.is_alive():
+            messagebox.showinfo("Export", "An export is already running. Please wait for it to finish.")
+            return
+            
         # Get save file path from user
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
@@ -849,38 +1310,101 @@ class ModInfoApp:
         if not file_path:
             return  # User cancelled
             
-        # Apply current filter to determine which mods to export
-        query = self.search_var.get().lower().strip()
-        filtered_mods = [
-            mod for mod in self.mods 
-            if (not query or 
-                query in mod["name"].lower() or 
-                query in mod["modid"].lower() or 
-                query in mod["workshopid"].lower())
-        ]
+        # Apply current filter to determine which mods to export, in the
+        # table's sort order; the query is already stripped and case-folded
+        query = self._lower_query
+        mods = self.mods
+        if query:
+            matches = self._find_matches(query)
+            filtered_mods = [mods[index] for index in self._order if index in matches]
+        else:
+            # No filter: skip per-row tests entirely
+            filtered_mods = list(map(mods.__getitem__, self._order))
+        
+        # Write on a background thread so large exports don't freeze the window;
+        # not a daemon, so closing the window lets the file finish writing
+        self.status_var.set(f"Exporting {len(filtered_mods)} mods…")
+        self._export_queue = queue.Queue()
+        self._export_thread = threading.Thread(
+            target=self._do_export, args=(file_path, filtered_mods, self._export_queue))
+        self._export_thread.start()
+        if self._export_poll is None:
+            self._export_poll = self.root.after(EXPORT_POLL_MS, self._drain_export_queue)
+
+    def _do_export(self, file_path: str, filtered_mods: List[Mod],
+                   results: queue.Queue) -> None:
+        """
+        Write the CSV export on a background thread.
+        
+        Never touches Tk; reports ("progress", rows_written, total) after each
+        chunk of EXPORT_CHUNK_ROWS rows, then either ("done", total) or
+        ("error", message).
         
+        Args:
+            file_path: Destination CSV file
+            filtered_mods: Mods to write, in export order
+            results: Queue drained by _drain_export_queue on the Tk thread
+        """
+        total = len(filtered_mods)
         try:
-            # Write CSV with proper encoding for international characters
-            with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-                
+            # Write CSV with proper encoding for international characters;
+            # a large buffer keeps the number of write syscalls small
+            with open(file_path, "w", newline="", encoding="utf-8",
+                      buffering=CSV_BUFFER_SIZE) as csvfile:
                 # Write header row
-                writer.writerow(["Name", "ModID", "WorkshopID"])
+                csvfile.write(_CSV_HEADER)
                 
-                # Write mod data
-                for mod in filtered_mods:
-                    writer.writerow([mod["name"], mod["modid"], mod["workshopid"]])
+                # Write mod data a chunk at a time, one write per chunk,
+                # reporting progress in between
+                for start in range(0, total, EXPORT_CHUNK_ROWS):
+                    chunk = filtered_mods[start:start + EXPORT_CHUNK_ROWS]
+                    csvfile.write(_csv_lines(chunk))
+                    results.put(("progress", start + len(chunk), total))
                     
-            self.status_var.set(f"Successfully exported {len(filtered_mods)} mods to CSV.")
+            results.put(("done", total))
             
         except PermissionError:
-            messagebox.showerror("Export Error", 
+            results.put(("error",
                 f"Permission denied writing to: {file_path}\n\n"
-                "The file may be open in another program.")
+                "The file may be open in another program."))
         except OSError as e:
-            messagebox.showerror("Export Error", f"System error writing file: {e}")
+            results.put(("error", f"System error writing file: {e}"))
         except Exception as e:
-            messagebox.showerror("Export Error", f"Unexpected error during export: {e}")
+            logger.exception("Unexpected error exporting %s", file_path)
+            results.put(("error", f"Unexpected error during export: {e}"))
+
+    def _drain_export_queue(self) -> None:
+        """
+        Apply messages posted by the running export worker on the Tk thread.
+        
+        Shows progress in the status bar and, once the worker finishes,
+        reports success there or shows the error dialog. Reschedules itself
+        until the export completes.
+        """
+        self._export_poll = None
+        results = self._export_queue
+        if results is None:
+            return
+            
+        try:
+            while True:
+                message = results.get_nowait()
+                kind = message[0]
+                if kind == "progress":
+                    self.status_var.set(f"Exporting… ({message[1]}/{message[2]} mods)")
+                elif kind == "done":
+                    self._export_queue = None
+                    self.status_var.set(f"Successfully exported {message[1]} mods to CSV.")
+                    return
+                elif kind == "error":
+                    self._export_queue = None
+                    self.status_var.set("Export failed.")
+                    messagebox.showerror("Export Error", message[1])
+                    return
+        except queue.Empty:
+            pass
+            
+        self._export_poll = self.root.after(EXPORT_POLL_MS, self._drain_export_queue)
 
 
 def main() -> None:
@@ -894,6 +1418,8 @@ def main() -> None:
     displaying user-friendly error messages.
     """
     try:
+        _setup_logging()
+        
         # Create and configure main window
         root = tk.Tk()
         